@@ -2,7 +2,16 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+# Imported once at module load rather than on every client construction.
+try:
+    from groq import AsyncGroq, Groq  # type: ignore
+except Exception as _exc:  # pragma: no cover - only hit when groq missing
+    AsyncGroq = Groq = None  # type: ignore[assignment,misc]
+    _GROQ_IMPORT_ERROR: Optional[BaseException] = _exc
+else:
+    _GROQ_IMPORT_ERROR = None
 
 
 class GroqImportError(ImportError):
@@ -29,12 +38,40 @@ def _load_int_env(name: str, default: Optional[int]) -> Optional[int]:
         return default
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GroqConfig:
+    """
+    Groq settings. Fields left as None are read from the environment when the
+    config is created (not when this module is imported), so env changes made
+    after import, e.g. by load_dotenv, are picked up.
+
+    None always means "use the environment or the default", so it cannot be
+    used to leave a setting out of the request: temperature=None still sends
+    LLM_TEMPERATURE (or 0.2). max_tokens is only omitted when LLM_MAX_TOKENS
+    is unset too.
+    """
+
     api_key: Optional[str] = None
-    model: str = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-    temperature: Optional[float] = _load_float_env("LLM_TEMPERATURE", 0.2)
-    max_tokens: Optional[int] = _load_int_env("LLM_MAX_TOKENS", None)
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+    max_tokens: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: fill the env-backed defaults via object.__setattr__.
+        if self.model is None:
+            object.__setattr__(self, "model", os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"))
+        if self.temperature is None:
+            object.__setattr__(self, "temperature", _load_float_env("LLM_TEMPERATURE", 0.2))
+        if self.max_tokens is None:
+            object.__setattr__(self, "max_tokens", _load_int_env("LLM_MAX_TOKENS", None))
+
+    @classmethod
+    def from_env(cls) -> "GroqConfig":
+        """
+        Build a config entirely from the environment: GROQ_API_KEY, GROQ_MODEL,
+        LLM_TEMPERATURE and LLM_MAX_TOKENS.
+        """
+        return cls(api_key=os.getenv("GROQ_API_KEY") or None)
 
 
 class GroqLLMClient:
@@ -46,16 +83,17 @@ class GroqLLMClient:
     """
 
     def __init__(self, config: Optional[GroqConfig] = None) -> None:
-        try:
-            from groq import Groq  # type: ignore
-        except Exception as exc:  # pragma: no cover - only hit when groq missing
+        if Groq is None:  # pragma: no cover - only hit when groq missing
             raise GroqImportError(
                 "The 'groq' package is required for GroqLLMClient. "
                 "Install it with: pip install groq"
-            ) from exc
+            ) from _GROQ_IMPORT_ERROR
 
         self._GroqClass = Groq
-        self.config = config or GroqConfig()
+        self._AsyncGroqClass = AsyncGroq
+        self.config = config or GroqConfig.from_env()
+        # Created on first async call so sync-only users don't open a second pool.
+        self._aclient: Any = None
 
         # Groq client will read GROQ_API_KEY from env if api_key is not passed explicitly.
         if self.config.api_key:
@@ -92,6 +130,68 @@ class GroqLLMClient:
         kwargs:
             Additional arguments forwarded to Groq (e.g. top_p).
         """
+        params = self._build_params(messages, model, temperature, max_tokens, **kwargs)
+        completion = self._client.chat.completions.create(**params)
+        choice = completion.choices[0]
+        return choice.message.content or ""
+
+    async def chat_completion_async(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Async counterpart of chat_completion, backed by Groq's AsyncGroq client.
+
+        Accepts the same parameters as chat_completion.
+        """
+        if self._aclient is None:
+            if self.config.api_key:
+                self._aclient = self._AsyncGroqClass(api_key=self.config.api_key)
+            else:
+                self._aclient = self._AsyncGroqClass()
+
+        params = self._build_params(messages, model, temperature, max_tokens, **kwargs)
+        completion = await self._aclient.chat.completions.create(**params)
+        choice = completion.choices[0]
+        return choice.message.content or ""
+
+    def chat_completion_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """
+        Perform a streaming chat completion, yielding text deltas as they arrive.
+
+        Accepts the same parameters as chat_completion.
+        """
+        params = self._build_params(messages, model, temperature, max_tokens, **kwargs)
+        params["stream"] = True
+        # The context manager closes the HTTP response even when the caller
+        # stops iterating early, instead of leaving it to garbage collection.
+        with self._client.chat.completions.create(**params) as stream:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    def _build_params(
+        self,
+        messages: List[Dict[str, Any]],
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         chosen_model = model or self.config.model
         chosen_temp = self.config.temperature if temperature is None else temperature
         chosen_max_tokens = self.config.max_tokens if max_tokens is None else max_tokens
@@ -106,8 +206,4 @@ class GroqLLMClient:
             params["max_tokens"] = chosen_max_tokens
 
         params.update(kwargs)
-
-        completion = self._client.chat.completions.create(**params)
-        choice = completion.choices[0]
-        return choice.message.content or ""
-
+        return params
@@ -1,21 +1,79 @@
 from __future__ import annotations
 
+import contextlib
+import copy
+import functools
+import hashlib
+import heapq
 import json
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+from json.decoder import scanstring
+from operator import itemgetter
+from typing import Any, Dict, Final, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover - falls back to the dict-based parser
+    msgspec = None  # type: ignore[assignment]
 
 from .llm_client import GroqLLMClient
 
 
-@dataclass
+def _json_dumps(obj: Any) -> str:
+    """
+    Serialize to compact JSON, using orjson when it is installed.
+    """
+    if orjson is not None:
+        # 'raw' passthrough dicts may carry non-string keys, which json allows.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_loads(text: str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # catch the stdlib exception for both backends.
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Max number of 'raw' passthrough fields sent to the model per candidate.
+_RAW_FIELDS_LIMIT = 8
+
+
+@dataclass(slots=True, frozen=True)
 class UserPreferences:
     price_preference: Optional[str] = None  # e.g. "low" | "medium" | "high" | "premium"
     location: Optional[str] = None  # e.g. "Bangalore, Indiranagar"
     min_rating: Optional[float] = None  # e.g. 4.0
     cuisine_preferences: Optional[List[str]] = None  # e.g. ["italian", "pizza"]
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize for the prompt, skipping empty fields for a cleaner prompt.
+        """
+        d: Dict[str, Any] = {}
+        if self.price_preference:
+            d["price_preference"] = self.price_preference
+        if self.location:
+            d["location"] = self.location
+        if self.min_rating is not None:
+            d["min_rating"] = self.min_rating
+        if self.cuisine_preferences:
+            d["cuisine_preferences"] = self.cuisine_preferences
+        return d
+
+
+@dataclass(slots=True, frozen=True)
 class RestaurantCandidate:
     id: str
     name: str
@@ -28,16 +86,48 @@ class RestaurantCandidate:
     # Optional raw fields if you want to pass through original dataset info.
     raw: Optional[Dict[str, Any]] = None
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize for the prompt, skipping empty fields.
+
+        Built by hand rather than via dataclasses.asdict, which deep-copies
+        every field and is noticeably slower for up to 50 candidates per call.
+        """
+        d: Dict[str, Any] = {"id": self.id, "name": self.name}
+        if self.city:
+            d["city"] = self.city
+        if self.locality:
+            d["locality"] = self.locality
+        if self.price_bucket:
+            d["price_bucket"] = self.price_bucket
+        if self.rating is not None:
+            d["rating"] = self.rating
+        if self.cuisines:
+            d["cuisines"] = self.cuisines
+        # Avoid huge raw payloads; keep only the first few fields of 'raw'.
+        # islice stops early instead of materializing every key of wide rows.
+        if self.raw and isinstance(self.raw, dict):
+            d["raw"] = dict(islice(self.raw.items(), _RAW_FIELDS_LIMIT))
+        return d
+
+
+@dataclass(slots=True, frozen=True)
 class LLMRecommendation:
     restaurant_id: Optional[str]
     restaurant_name: str
     match_score: Optional[float]
     reason: str
 
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> "LLMRecommendation":
+        """
+        Project one parsed recommendation object onto the fields we use.
+        """
+        get = item.get
+        return cls(get("restaurant_id"), get("restaurant_name") or "", get("match_score"), get("reason") or "")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LLMRecommendationsResult:
     title: str
     summary: str
@@ -45,17 +135,93 @@ class LLMRecommendationsResult:
     raw_response_text: str
 
 
-def _build_system_prompt() -> str:
-    return (
-        "You are an AI restaurant recommendation assistant. "
-        "Given a user's preferences and a list of candidate restaurants, "
-        "you must select and clearly explain the best options for the user.\n\n"
-        "Requirements:\n"
-        "- Always base your answer ONLY on the provided candidate restaurants.\n"
-        "- Prefer restaurants that match the requested cuisine, location, and price level.\n"
-        "- Prefer higher ratings, but explain trade-offs when needed.\n"
-        "- Output strictly in the JSON schema described in the instructions."
-    )
+# Prompt text that does not depend on the request is built once at import.
+_SYSTEM_PROMPT: Final[str] = (
+    "You are an AI restaurant recommendation assistant. "
+    "Given a user's preferences and a list of candidate restaurants, "
+    "you must select and clearly explain the best options for the user.\n\n"
+    "Requirements:\n"
+    "- Always base your answer ONLY on the provided candidate restaurants.\n"
+    "- Prefer restaurants that match the requested cuisine, location, and price level.\n"
+    "- Prefer higher ratings, but explain trade-offs when needed.\n"
+    "- Output strictly in the JSON schema described in the instructions."
+)
+
+_RESPONSE_SCHEMA: Dict[str, Any] = {
+    "title": "Short title summarizing the recommendation context",
+    "summary": "1-2 paragraphs explaining your high-level reasoning",
+    "recommendations": [
+        {
+            "restaurant_id": "id string or null",
+            "restaurant_name": "string",
+            "match_score": "number between 0 and 100 reflecting how well it matches the user preferences",
+            "reason": "1-3 sentences explaining why this restaurant is a good choice",
+        }
+    ],
+}
+
+_SCHEMA_JSON: Final[str] = _json_dumps(_RESPONSE_SCHEMA)
+
+# Byte-identical across requests and placed before any per-request data, so
+# providers that cache the longest shared prompt prefix can reuse it.
+_STATIC_PROMPT_PREFIX: Final[str] = (
+    "You are given:\n"
+    "1) user_preferences: the user's stated preferences,\n"
+    "2) candidate_restaurants: a list of possible restaurants that you MUST choose from, and\n"
+    "3) max_recommendations: the maximum number of restaurants to select.\n\n"
+    "Select up to max_recommendations restaurants that best match the preferences.\n"
+    "Return ONLY a single JSON object matching the response_schema below. "
+    "Do not include any extra commentary or markdown.\n\n"
+    "response_schema:\n"
+    + _SCHEMA_JSON
+    + "\n\ninput:"
+)
+
+
+def _select_candidates(
+    user_preferences: UserPreferences,
+    candidates: List[RestaurantCandidate],
+    max_recommendations: int,
+) -> List[RestaurantCandidate]:
+    """
+    Drop duplicate IDs, apply the hard preference filters locally and keep
+    the best-scoring candidates, so the model only sees restaurants it could
+    recommend, each once.
+
+    Falls back to the unfiltered candidates when nothing passes, letting the
+    model explain the closest trade-offs instead.
+    """
+    limit = min(50, max(3 * max_recommendations, 10))
+    min_rating = user_preferences.min_rating
+    price = (user_preferences.price_preference or "").strip().lower()
+    wanted = {x.strip().lower() for x in user_preferences.cuisine_preferences or [] if x and x.strip()}
+
+    # Upstream filters can return the same restaurant more than once; keep
+    # the first occurrence so duplicates don't burn prompt tokens.
+    seen_ids = set()
+    unique: List[RestaurantCandidate] = []
+    for c in candidates:
+        if c.id not in seen_ids:
+            seen_ids.add(c.id)
+            unique.append(c)
+
+    scored = []
+    for c in unique:
+        rating = c.rating or 0.0
+        if min_rating is not None and rating < min_rating:
+            continue
+        if price and (c.price_bucket or "").strip().lower() != price:
+            continue
+        overlap = 0
+        if wanted:
+            overlap = sum(1 for x in c.cuisines or [] if x and x.strip().lower() in wanted)
+            if not overlap:
+                continue
+        scored.append((rating + overlap, c))
+
+    if not scored:
+        return unique[:limit]
+    return [c for _, c in heapq.nlargest(limit, scored, key=itemgetter(0))]
 
 
 def _build_user_prompt(
@@ -63,109 +229,301 @@ def _build_user_prompt(
     candidates: List[RestaurantCandidate],
     max_recommendations: int,
 ) -> str:
-    prefs_dict = asdict(user_preferences)
-    # Trim None fields for a cleaner prompt.
-    clean_prefs = {k: v for k, v in prefs_dict.items() if v not in (None, [], "")}
-
-    # Limit how many candidates we send to the model for context.
-    truncated_candidates = candidates[:50]
-    serialized_candidates: List[Dict[str, Any]] = []
-    for c in truncated_candidates:
-        d = asdict(c)
-        # Avoid huge raw payloads; keep only shallow fields in 'raw'.
-        if d.get("raw") and isinstance(d["raw"], dict):
-            d["raw"] = {k: d["raw"][k] for k in list(d["raw"])[:8]}
-        serialized_candidates.append(d)
-
-    schema_description = {
-        "title": "Short title summarizing the recommendation context",
-        "summary": "1-2 paragraphs explaining your high-level reasoning",
-        "recommendations": [
-            {
-                "restaurant_id": "id string or null",
-                "restaurant_name": "string",
-                "match_score": "number between 0 and 100 reflecting how well it matches the user preferences",
-                "reason": "1-3 sentences explaining why this restaurant is a good choice",
-            }
-        ],
-    }
-
-    prompt = {
-        "instructions": (
-            "You are given:\n"
-            "1) user_preferences: the user's stated preferences, and\n"
-            "2) candidate_restaurants: a list of possible restaurants that you MUST choose from.\n\n"
-            f"Select up to {max_recommendations} restaurants that best match the preferences.\n"
-            "Return ONLY a single JSON object matching the 'response_schema' below. "
-            "Do not include any extra commentary or markdown.\n"
-        ),
-        "user_preferences": clean_prefs,
-        "candidate_restaurants": serialized_candidates,
-        "response_schema": schema_description,
-    }
-
-    # Keep it as compact JSON for better token efficiency.
-    return json.dumps(prompt, ensure_ascii=False, indent=2)
+    dynamic_part = _json_dumps(
+        {
+            "max_recommendations": max_recommendations,
+            "user_preferences": user_preferences.to_dict(),
+            "candidate_restaurants": [
+                c.to_dict()
+                for c in _select_candidates(user_preferences, candidates, max_recommendations)
+            ],
+        }
+    )
+    return _STATIC_PROMPT_PREFIX + "\n" + dynamic_part
+
+
+# The expected response shape, compiled once at import. Text fields may be
+# null (defaults are filled in), unknown fields are ignored, and anything
+# else is rejected so callers can retry immediately instead of acting on a
+# half-understood answer.
+if msgspec is not None:
+
+    class _RecommendationPayload(msgspec.Struct):
+        restaurant_id: Union[str, int, None] = None
+        restaurant_name: Optional[str] = None
+        match_score: Optional[float] = None
+        reason: Optional[str] = None
+
+    class _ResponsePayload(msgspec.Struct):
+        title: Optional[str] = None
+        summary: Optional[str] = None
+        recommendations: Optional[List[_RecommendationPayload]] = None
+
+    # Decodes and validates straight into typed structs in C, skipping fields
+    # we don't use. strict=False lets e.g. a quoted "85" match_score coerce to
+    # a float.
+    _response_decoder: Any = msgspec.json.Decoder(_ResponsePayload, strict=False)
+    _JSON_DECODE_ERRORS: Tuple[type, ...] = (json.JSONDecodeError, msgspec.DecodeError)
+else:  # pragma: no cover
+    _response_decoder = None
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+
+def _schema_error(detail: Any, text: str) -> ValueError:
+    snippet = text[:500]
+    return ValueError(f"LLM response does not match the expected schema: {detail}. Snippet: {snippet!r}")
+
+
+# Numeric strings msgspec's strict=False decoder coerces to float: a JSON
+# number, or nan/inf/infinity in any case.
+_NUMERIC_STR_RE = re.compile(
+    r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|[-+]?(?:nan|inf|infinity)",
+    re.IGNORECASE,
+)
+
+
+def _coerce_match_score(value: Any) -> Tuple[bool, Optional[float]]:
+    """Return (ok, value) for match_score, coerced as _RecommendationPayload would."""
+    if value is None:
+        return True, None
+    if isinstance(value, bool):
+        return False, None
+    if isinstance(value, (int, float)):
+        return True, float(value)
+    if isinstance(value, str) and _NUMERIC_STR_RE.fullmatch(value):
+        return True, float(value)
+    return False, None
+
+
+def _coerce_restaurant_id(value: Any) -> Tuple[bool, Union[str, int, None]]:
+    """Return (ok, value) for restaurant_id, coerced as _RecommendationPayload would."""
+    if value is None or isinstance(value, str):
+        return True, value
+    if isinstance(value, bool):
+        return False, None
+    if isinstance(value, int):
+        return True, value
+    if isinstance(value, float) and value.is_integer():
+        return True, int(value)
+    return False, None
+
+
+def _check_response_shape(data: Any) -> Optional[str]:
+    """
+    Same checks as _ResponsePayload, for when msgspec is not installed.
+    Coerces match_score and restaurant_id in place the way the strict=False
+    decoder does, so both paths accept and produce the same values.
+    Returns a description of the first violation, or None if valid.
+    """
+    if not isinstance(data, dict):
+        return "expected a JSON object"
+    for key in ("title", "summary"):
+        if not isinstance(data.get(key), (str, type(None))):
+            return f"{key!r} must be a string or null"
+    recs = data.get("recommendations")
+    if recs is None:
+        return None
+    if not isinstance(recs, list):
+        return "'recommendations' must be an array or null"
+    for i, item in enumerate(recs):
+        if not isinstance(item, dict):
+            return f"recommendations[{i}] must be an object"
+        for key in ("restaurant_name", "reason"):
+            if not isinstance(item.get(key), (str, type(None))):
+                return f"recommendations[{i}].{key} must be a string or null"
+        ok, score = _coerce_match_score(item.get("match_score"))
+        if not ok:
+            return f"recommendations[{i}].match_score must be a number or null"
+        ok, restaurant_id = _coerce_restaurant_id(item.get("restaurant_id"))
+        if not ok:
+            return f"recommendations[{i}].restaurant_id must be a string, integer or null"
+        item["match_score"] = score
+        item["restaurant_id"] = restaurant_id
+    return None
+
+
+def _parse_json_body(body: str, text: str) -> LLMRecommendationsResult:
+    """
+    Parse and validate the JSON ``body`` extracted from the response ``text``.
+
+    Raises one of _JSON_DECODE_ERRORS when ``body`` is not valid JSON, and a
+    plain ValueError when it is valid JSON of the wrong shape.
+    """
+    if _response_decoder is not None:
+        try:
+            payload = _response_decoder.decode(body)
+        except msgspec.ValidationError as exc:
+            raise _schema_error(exc, text) from exc
+
+        return LLMRecommendationsResult(
+            title=payload.title or "Restaurant Recommendations",
+            summary=payload.summary or "",
+            recommendations=[
+                LLMRecommendation(
+                    restaurant_id=r.restaurant_id,
+                    restaurant_name=r.restaurant_name or "",
+                    match_score=r.match_score,
+                    reason=r.reason or "",
+                )
+                for r in payload.recommendations or ()
+            ],
+            raw_response_text=text,
+        )
+
+    data = _json_loads(body)
+    problem = _check_response_shape(data)
+    if problem is not None:
+        raise _schema_error(problem, text)
+
+    return LLMRecommendationsResult(
+        title=data.get("title") or "Restaurant Recommendations",
+        summary=data.get("summary") or "",
+        recommendations=[LLMRecommendation.from_dict(item) for item in data.get("recommendations") or ()],
+        raw_response_text=text,
+    )
+
+
+def _strip_code_fences(text: str) -> str:
+    """
+    Remove a markdown code fence (```json ... ```) that models sometimes wrap
+    around the JSON despite being told not to.
+    """
+    stripped = text.strip()
+    if not stripped.startswith("```"):
+        return stripped
+    newline = stripped.find("\n")
+    # Drop the opening fence together with its optional language tag.
+    stripped = stripped[newline + 1 :] if newline != -1 else stripped[3:]
+    return stripped.removesuffix("```").strip()
 
 
 def _parse_llm_response(text: str) -> LLMRecommendationsResult:
     """
     Parse the LLM's JSON response text into a structured dataclass.
+
+    Tolerates markdown code fences and stray prose around the JSON object,
+    which would otherwise cost a full retry round-trip. Raises ValueError if
+    no JSON can be decoded or it does not match the expected schema.
     """
+    body = _strip_code_fences(text)
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError as exc:
+        return _parse_json_body(body, text)
+    except _JSON_DECODE_ERRORS as exc:
+        # Last resort: the outermost {...} span, e.g. "Here you go: {...}".
+        start, end = body.find("{"), body.rfind("}") + 1
+        if 0 <= start < end and (start, end) != (0, len(body)):
+            try:
+                return _parse_json_body(body[start:end], text)
+            except _JSON_DECODE_ERRORS:
+                pass
         # Surface a descriptive error that can be logged or handled upstream.
         snippet = text[:500]
         raise ValueError(f"Failed to parse LLM JSON response: {exc}. Snippet: {snippet!r}") from exc
 
-    title = data.get("title") or "Restaurant Recommendations"
-    summary = data.get("summary") or ""
 
-    recs_data = data.get("recommendations") or []
-    recommendations: List[LLMRecommendation] = []
+_TITLE_FIELD_RE = re.compile(r'"title"\s*:\s*"')
+_SUMMARY_FIELD_RE = re.compile(r'"summary"\s*:\s*"')
+_SUMMARY_KEY = '"summary"'
 
-    for item in recs_data:
-        if not isinstance(item, dict):
-            continue
 
-        recommendations.append(
-            LLMRecommendation(
-                restaurant_id=item.get("restaurant_id"),
-                restaurant_name=item.get("restaurant_name") or "",
-                match_score=item.get("match_score"),
-                reason=item.get("reason") or "",
-            )
-        )
+def _scan_string_field(text: str, pattern: "re.Pattern[str]", pos: int = 0) -> Optional[str]:
+    """
+    Return the value of a top-level string field from possibly incomplete JSON,
+    or None if the field has not been fully emitted yet. The field is looked
+    up from offset ``pos`` onwards.
+    """
+    match = pattern.search(text, pos)
+    if match is None:
+        return None
+    try:
+        value, _ = scanstring(text, match.end())
+    except ValueError:
+        # Unterminated string or truncated escape; more text is on its way.
+        return None
+    return value
 
+
+def _parse_partial_response(text: str, summary_pos: int = 0) -> Optional[LLMRecommendationsResult]:
+    """
+    Build an early result (title + summary, no recommendations yet) from a
+    response that is still streaming. Returns None until the summary is complete.
+    ``summary_pos`` is where to start looking for the summary field, e.g.
+    where its key is already known to start.
+    """
+    summary = _scan_string_field(text, _SUMMARY_FIELD_RE, summary_pos)
+    if summary is None:
+        return None
+    title = _scan_string_field(text, _TITLE_FIELD_RE)
     return LLMRecommendationsResult(
-        title=title,
+        title=title or "Restaurant Recommendations",
         summary=summary,
-        recommendations=recommendations,
+        recommendations=[],
         raw_response_text=text,
     )
 
 
-def generate_restaurant_recommendations(
+# Identical requests (same model, sampling settings and prompt) are common
+# within a session, e.g. when a user resubmits the same filters; serve those
+# without a network call.
+_RESPONSE_CACHE_MAXSIZE = 256
+_response_cache: "OrderedDict[str, LLMRecommendationsResult]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(client: GroqLLMClient, user_prompt: str) -> str:
+    # The cache is process-wide, so everything that changes the answer for a
+    # given prompt is part of the key, not just the model.
+    config = client.config
+    h = hashlib.blake2b(digest_size=16)
+    for part in (client.model, repr(config.temperature), repr(config.max_tokens), user_prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[LLMRecommendationsResult]:
+    with _response_cache_lock:
+        result = _response_cache.get(key)
+        if result is None:
+            return None
+        _response_cache.move_to_end(key)
+    # Hand out copies so callers cannot mutate the cached entry.
+    return copy.deepcopy(result)
+
+
+def _response_cache_put(key: str, result: LLMRecommendationsResult) -> None:
+    with _response_cache_lock:
+        _response_cache[key] = copy.deepcopy(result)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAXSIZE:
+            _response_cache.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_client() -> GroqLLMClient:
+    """
+    Process-wide client used when callers don't pass one, so the underlying
+    HTTP connection pool (and its keep-alive connections) is reused.
+    """
+    return GroqLLMClient()
+
+
+def _prepare_request(
     user_preferences: UserPreferences,
     candidates: List[RestaurantCandidate],
-    max_recommendations: int = 5,
-    client: Optional[GroqLLMClient] = None,
-) -> LLMRecommendationsResult:
+    max_recommendations: int,
+    client: Optional[GroqLLMClient],
+    use_cache: bool,
+) -> Tuple[GroqLLMClient, List[Dict[str, Any]], Optional[str]]:
     """
-    Main entry point for Phase 3.
+    Shared setup for the sync and async entry points.
 
-    - Builds the system + user prompts.
-    - Calls Groq's chat completion API via GroqLLMClient.
-    - Parses the JSON result into a strongly-typed object.
-
-    This function does not perform any network calls unless a Groq API key
-    is available and the Groq client is installed.
+    Returns the client to use, the chat messages, and the response cache key
+    (None when caching is disabled).
     """
     if not candidates:
         raise ValueError("generate_restaurant_recommendations requires at least one candidate restaurant.")
 
-    system_prompt = _build_system_prompt()
     user_prompt = _build_user_prompt(
         user_preferences=user_preferences,
         candidates=candidates,
@@ -173,19 +531,138 @@ def generate_restaurant_recommendations(
     )
 
     if client is None:
-        client = GroqLLMClient()
+        client = _default_client()
+
+    cache_key = _response_cache_key(client, user_prompt) if use_cache else None
 
     messages: List[Dict[str, Any]] = [
         {
             "role": "system",
-            "content": system_prompt,
+            "content": _SYSTEM_PROMPT,
         },
         {
             "role": "user",
             "content": user_prompt,
         },
     ]
+    return client, messages, cache_key
+
+
+def _finish_request(response_text: str, cache_key: Optional[str]) -> LLMRecommendationsResult:
+    result = _parse_llm_response(response_text)
+    if cache_key is not None:
+        _response_cache_put(cache_key, result)
+    return result
+
+
+def generate_restaurant_recommendations(
+    user_preferences: UserPreferences,
+    candidates: List[RestaurantCandidate],
+    max_recommendations: int = 5,
+    client: Optional[GroqLLMClient] = None,
+    use_cache: bool = True,
+) -> LLMRecommendationsResult:
+    """
+    Main entry point for Phase 3.
+
+    - Narrows the candidates with the hard filters (rating, price, cuisine).
+    - Builds the system + user prompts.
+    - Calls Groq's chat completion API via GroqLLMClient.
+    - Parses the JSON result into a strongly-typed object.
+    - Reuses a previous result for an identical model, temperature,
+      max_tokens and prompt unless ``use_cache`` is False.
+
+    This function does not perform any network calls unless a Groq API key
+    is available and the Groq client is installed.
+    """
+    client, messages, cache_key = _prepare_request(
+        user_preferences, candidates, max_recommendations, client, use_cache
+    )
+    if cache_key is not None:
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return cached
 
     response_text = client.chat_completion(messages=messages)
-    return _parse_llm_response(response_text)
+    return _finish_request(response_text, cache_key)
 
+
+async def generate_restaurant_recommendations_async(
+    user_preferences: UserPreferences,
+    candidates: List[RestaurantCandidate],
+    max_recommendations: int = 5,
+    client: Optional[GroqLLMClient] = None,
+    use_cache: bool = True,
+) -> LLMRecommendationsResult:
+    """
+    Async variant of generate_restaurant_recommendations.
+
+    Several calls can be awaited together with asyncio.gather so their
+    network round-trips overlap instead of running back to back.
+    """
+    client, messages, cache_key = _prepare_request(
+        user_preferences, candidates, max_recommendations, client, use_cache
+    )
+    if cache_key is not None:
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    response_text = await client.chat_completion_async(messages=messages)
+    return _finish_request(response_text, cache_key)
+
+
+def stream_restaurant_recommendations(
+    user_preferences: UserPreferences,
+    candidates: List[RestaurantCandidate],
+    max_recommendations: int = 5,
+    client: Optional[GroqLLMClient] = None,
+    use_cache: bool = True,
+) -> Iterator[LLMRecommendationsResult]:
+    """
+    Streaming variant of generate_restaurant_recommendations.
+
+    Yields a partial result with the title and summary (and no
+    recommendations) as soon as the model has finished emitting the summary,
+    then the complete parsed result. Only the complete result is cached; a
+    cache hit yields it once and makes no network call.
+    """
+    client, messages, cache_key = _prepare_request(
+        user_preferences, candidates, max_recommendations, client, use_cache
+    )
+    if cache_key is not None:
+        cached = _response_cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+    parts: List[str] = []
+    length = 0
+    # Until the summary key shows up, only the new delta (plus a short tail
+    # for a key split across deltas) is searched; afterwards the text is only
+    # joined and scanned when a delta could close the summary string.
+    tail = ""
+    summary_at = -1
+    partial_sent = False
+    # closing() ends the underlying HTTP stream if our caller stops early.
+    with contextlib.closing(client.chat_completion_stream(messages=messages)) as deltas:
+        for delta in deltas:
+            parts.append(delta)
+            start, length = length, length + len(delta)
+            if partial_sent:
+                continue
+            if summary_at < 0:
+                window = tail + delta
+                found = window.find(_SUMMARY_KEY)
+                if found < 0:
+                    tail = window[-(len(_SUMMARY_KEY) - 1) :]
+                    continue
+                summary_at = start - len(tail) + found
+            elif '"' not in delta:
+                continue
+            partial = _parse_partial_response("".join(parts), summary_at)
+            if partial is not None:
+                partial_sent = True
+                yield partial
+
+    yield _finish_request("".join(parts), cache_key)
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from phase3_llm import orchestrator
+from phase3_llm.llm_client import GroqConfig
+
+RESPONSE = json.dumps(
+    {
+        "title": "Italian in Indiranagar",
+        "summary": "Closest match.",
+        "recommendations": [
+            {"restaurant_id": "123", "restaurant_name": "La Piazza", "match_score": 90, "reason": "Italian."}
+        ],
+    }
+)
+
+
+class StubClient:
+    """
+    Stands in for GroqLLMClient without a network: returns the canned
+    response ``text`` and counts calls. Streams it in ``chunk_size`` deltas,
+    recording how much was sent and whether the stream was closed.
+    """
+
+    def __init__(self, text=RESPONSE, model="stub-model", temperature=0.2, max_tokens=None, chunk_size=1):
+        self.config = GroqConfig(api_key="test", model=model, temperature=temperature, max_tokens=max_tokens)
+        self.text = text
+        self.chunk_size = chunk_size
+        self.calls = 0
+        self.sent = 0
+        self.closed = False
+
+    @property
+    def model(self):
+        return self.config.model
+
+    def chat_completion(self, messages, **kwargs):
+        self.calls += 1
+        return self.text
+
+    async def chat_completion_async(self, messages, **kwargs):
+        self.calls += 1
+        return self.text
+
+    def chat_completion_stream(self, messages, **kwargs):
+        self.calls += 1
+        try:
+            for i in range(0, len(self.text), self.chunk_size):
+                self.sent = i + self.chunk_size
+                yield self.text[i : i + self.chunk_size]
+        finally:
+            self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """The response cache is process-wide; start and end every test with it empty."""
+    orchestrator._response_cache.clear()
+    yield
+    orchestrator._response_cache.clear()
@@ -0,0 +1,72 @@
+import asyncio
+from types import SimpleNamespace
+
+from phase3_llm.llm_client import GroqConfig, GroqLLMClient
+from phase3_llm.orchestrator import (
+    RestaurantCandidate,
+    UserPreferences,
+    _parse_llm_response,
+    generate_restaurant_recommendations,
+    generate_restaurant_recommendations_async,
+)
+
+from conftest import RESPONSE, StubClient
+
+PREFS = UserPreferences(cuisine_preferences=["italian"])
+CANDIDATES = [
+    RestaurantCandidate(id="123", name="La Piazza", rating=4.4, cuisines=["italian"]),
+    RestaurantCandidate(id="456", name="Budget Bites", rating=4.0, cuisines=["indian"]),
+]
+
+
+async def _gather(client, *max_recommendations, **kwargs):
+    return await asyncio.gather(
+        *(
+            generate_restaurant_recommendations_async(PREFS, CANDIDATES, max_recommendations=n, client=client, **kwargs)
+            for n in max_recommendations
+        )
+    )
+
+
+def test_gathered_calls_fill_the_cache_shared_with_sync_entry_point():
+    client = StubClient()
+    results = asyncio.run(_gather(client, 1, 2))
+    assert client.calls == 2
+    assert results == [_parse_llm_response(RESPONSE)] * 2
+
+    sync_result = generate_restaurant_recommendations(PREFS, CANDIDATES, max_recommendations=2, client=client)
+    assert client.calls == 2
+    assert sync_result == results[1]
+
+
+def test_gathered_calls_are_served_from_sync_cache_entry():
+    client = StubClient()
+    generate_restaurant_recommendations(PREFS, CANDIDATES, max_recommendations=2, client=client)
+    asyncio.run(_gather(client, 2, 2))
+    assert client.calls == 1
+
+
+class _FakeAsyncGroq:
+    instances = 0
+
+    def __init__(self, **kwargs):
+        type(self).instances += 1
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **params):
+        await asyncio.sleep(0)
+        message = SimpleNamespace(content=RESPONSE)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_async_groq_client_is_created_once(monkeypatch):
+    monkeypatch.setattr(_FakeAsyncGroq, "instances", 0)
+    client = GroqLLMClient(GroqConfig(api_key="test", model="stub-model"))
+    client._AsyncGroqClass = _FakeAsyncGroq
+
+    results = asyncio.run(_gather(client, 1, 2, use_cache=False))
+    assert results == [_parse_llm_response(RESPONSE)] * 2
+    assert _FakeAsyncGroq.instances == 1
+
+    asyncio.run(client.chat_completion_async(messages=[]))
+    assert _FakeAsyncGroq.instances == 1
@@ -0,0 +1,58 @@
+import pytest
+
+from phase3_llm.llm_client import GroqConfig
+
+_ENV = ("GROQ_API_KEY", "GROQ_MODEL", "LLM_TEMPERATURE", "LLM_MAX_TOKENS")
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for name in _ENV:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.mark.parametrize("make", [GroqConfig, GroqConfig.from_env])
+def test_env_set_after_import_is_picked_up(clean_env, make):
+    clean_env.setenv("GROQ_MODEL", "env-model")
+    clean_env.setenv("LLM_TEMPERATURE", "0.7")
+    clean_env.setenv("LLM_MAX_TOKENS", "512")
+
+    config = make()
+    assert (config.model, config.temperature, config.max_tokens) == ("env-model", 0.7, 512)
+
+
+@pytest.mark.parametrize("make", [GroqConfig, GroqConfig.from_env])
+def test_defaults_when_env_is_unset(clean_env, make):
+    config = make()
+    assert (config.api_key, config.model, config.temperature, config.max_tokens) == (
+        None,
+        "llama-3.3-70b-versatile",
+        0.2,
+        None,
+    )
+
+
+def test_invalid_numbers_fall_back_to_defaults(clean_env):
+    clean_env.setenv("LLM_TEMPERATURE", "warm")
+    clean_env.setenv("LLM_MAX_TOKENS", "lots")
+    config = GroqConfig()
+    assert (config.temperature, config.max_tokens) == (0.2, None)
+
+
+def test_from_env_reads_api_key(clean_env):
+    clean_env.setenv("GROQ_API_KEY", "secret")
+    assert GroqConfig.from_env().api_key == "secret"
+    assert GroqConfig().api_key is None
+
+
+def test_explicit_values_override_env(clean_env):
+    clean_env.setenv("GROQ_MODEL", "env-model")
+    clean_env.setenv("LLM_TEMPERATURE", "0.7")
+    config = GroqConfig(model="explicit", temperature=0.0, max_tokens=64)
+    assert (config.model, config.temperature, config.max_tokens) == ("explicit", 0.0, 64)
+
+
+def test_none_reads_env_instead_of_disabling(clean_env):
+    clean_env.setenv("LLM_TEMPERATURE", "0.7")
+    assert GroqConfig(temperature=None).temperature == 0.7
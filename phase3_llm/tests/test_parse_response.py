@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from phase3_llm import orchestrator
+from phase3_llm.orchestrator import _parse_llm_response
+
+
+@pytest.fixture(params=["msgspec", "fallback"])
+def parser_path(request, monkeypatch):
+    """
+    Run each test against both validators: the msgspec decoder and the
+    dict-based fallback used when msgspec is not installed.
+    """
+    if request.param == "msgspec":
+        if orchestrator._response_decoder is None:
+            pytest.skip("msgspec not installed")
+    else:
+        monkeypatch.setattr(orchestrator, "_response_decoder", None)
+    return request.param
+
+
+def _response(**rec):
+    return json.dumps(
+        {
+            "title": "T",
+            "summary": "S",
+            "recommendations": [{"restaurant_name": "La Piazza", "reason": "Good.", **rec}],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "score, expected",
+    [
+        (85, 85.0),
+        (85.5, 85.5),
+        ("85", 85.0),
+        ("8.5e1", 85.0),
+        (None, None),
+    ],
+)
+def test_match_score_is_coerced_to_float(parser_path, score, expected):
+    rec = _parse_llm_response(_response(match_score=score)).recommendations[0]
+    assert rec.match_score == expected
+    assert rec.match_score is None or type(rec.match_score) is float
+
+
+@pytest.mark.parametrize("score", ["high", "", " 85 ", True, [85], {"value": 85}])
+def test_match_score_must_be_numeric(parser_path, score):
+    with pytest.raises(ValueError, match="does not match the expected schema"):
+        _parse_llm_response(_response(match_score=score))
+
+
+@pytest.mark.parametrize(
+    "restaurant_id, expected",
+    [("123", "123"), (123, 123), (1.0, 1), (None, None)],
+)
+def test_restaurant_id_accepts_str_int_or_null(parser_path, restaurant_id, expected):
+    rec = _parse_llm_response(_response(restaurant_id=restaurant_id)).recommendations[0]
+    assert rec.restaurant_id == expected
+    assert type(rec.restaurant_id) is type(expected)
+
+
+@pytest.mark.parametrize("restaurant_id", [1.5, True, False, ["123"]])
+def test_restaurant_id_rejects_other_types(parser_path, restaurant_id):
+    with pytest.raises(ValueError, match="does not match the expected schema"):
+        _parse_llm_response(_response(restaurant_id=restaurant_id))
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "[]",
+        '{"title": 1}',
+        '{"summary": ["S"]}',
+        '{"recommendations": {}}',
+        '{"recommendations": ["La Piazza"]}',
+        '{"recommendations": [{"restaurant_name": 1}]}',
+        '{"recommendations": [{"reason": false}]}',
+    ],
+)
+def test_wrong_shape_is_rejected(parser_path, body):
+    with pytest.raises(ValueError, match="does not match the expected schema"):
+        _parse_llm_response(body)
+
+
+def test_nulls_and_missing_fields_get_defaults(parser_path):
+    result = _parse_llm_response(
+        '{"title": null, "recommendations": [{"restaurant_name": null, "extra": 1}]}'
+    )
+    assert result.title == "Restaurant Recommendations"
+    assert result.summary == ""
+    rec = result.recommendations[0]
+    assert (rec.restaurant_id, rec.restaurant_name, rec.match_score, rec.reason) == (None, "", None, "")
+
+
+_VALID = '{"title": "T", "summary": "S", "recommendations": []}'
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        _VALID,
+        f"  {_VALID}\n",
+        f"```json\n{_VALID}\n```",
+        f"```\n{_VALID}\n```",
+        f"Here you go: {_VALID} Enjoy!",
+        f"```json\nSure! {_VALID}\n```",
+    ],
+)
+def test_fenced_or_wrapped_json_is_accepted(parser_path, text):
+    result = _parse_llm_response(text)
+    assert (result.title, result.summary, result.recommendations) == ("T", "S", [])
+    assert result.raw_response_text == text
+
+
+@pytest.mark.parametrize("text", ["", "no json here", "{not json}", '{"title": "T"', "```json\n```"])
+def test_undecodable_response_raises_value_error(parser_path, text):
+    with pytest.raises(ValueError, match="Failed to parse LLM JSON response"):
+        _parse_llm_response(text)
+
+
+@pytest.mark.parametrize("text", ['{"recommendations": "none"}', 'Result: {"recommendations": "none"}'])
+def test_wrong_shape_is_reported_as_schema_error(parser_path, text):
+    # Valid JSON of the wrong shape is reported as such, not as a decode error,
+    # whether or not it had to be cut out of surrounding prose.
+    with pytest.raises(ValueError, match="does not match the expected schema"):
+        _parse_llm_response(text)
@@ -0,0 +1,64 @@
+import pytest
+
+from phase3_llm import orchestrator
+from phase3_llm.orchestrator import (
+    RestaurantCandidate,
+    UserPreferences,
+    generate_restaurant_recommendations,
+)
+
+from conftest import StubClient
+
+PREFS = UserPreferences(location="Bangalore, Indiranagar", cuisine_preferences=["italian"])
+CANDIDATES = [
+    RestaurantCandidate(id="123", name="La Piazza", rating=4.4, cuisines=["italian", "pizza"]),
+    RestaurantCandidate(id="456", name="Budget Bites", rating=4.0, cuisines=["indian"]),
+]
+
+
+def _generate(client, **kwargs):
+    return generate_restaurant_recommendations(PREFS, CANDIDATES, max_recommendations=2, client=client, **kwargs)
+
+
+def test_identical_request_is_served_from_cache():
+    client = StubClient()
+    first = _generate(client)
+    second = _generate(client)
+    assert client.calls == 1
+    assert second == first
+
+
+def test_different_prompt_misses_cache():
+    client = StubClient()
+    _generate(client)
+    generate_restaurant_recommendations(PREFS, CANDIDATES, max_recommendations=1, client=client)
+    assert client.calls == 2
+
+
+def test_use_cache_false_bypasses_and_does_not_store():
+    client = StubClient()
+    _generate(client, use_cache=False)
+    _generate(client, use_cache=False)
+    assert client.calls == 2
+    assert not orchestrator._response_cache
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        {"model": "other-model"},
+        {"temperature": 0.9},
+        {"max_tokens": 256},
+    ],
+)
+def test_clients_with_different_settings_do_not_share_entries(other):
+    first, second = StubClient(), StubClient(**other)
+    _generate(first)
+    _generate(second)
+    assert (first.calls, second.calls) == (1, 1)
+
+
+def test_cached_result_is_a_copy():
+    client = StubClient()
+    _generate(client).recommendations.clear()
+    assert len(_generate(client).recommendations) == 1
@@ -0,0 +1,66 @@
+import pytest
+
+from phase3_llm.orchestrator import RestaurantCandidate, UserPreferences, _select_candidates
+
+
+def _candidate(id, rating=4.0, price="medium", cuisines=("italian",)):
+    return RestaurantCandidate(
+        id=str(id), name=f"R{id}", rating=rating, price_bucket=price, cuisines=list(cuisines)
+    )
+
+
+def _ids(selected):
+    return [c.id for c in selected]
+
+
+def test_duplicate_ids_keep_first_occurrence():
+    first = _candidate(1, rating=3.0)
+    selected = _select_candidates(UserPreferences(), [first, _candidate(2), _candidate(1, rating=5.0)], 5)
+    assert _ids(selected) == ["2", "1"]
+    assert selected[1] is first
+
+
+def test_fallback_is_deduplicated():
+    candidates = [_candidate(1, rating=3.0), _candidate(1, rating=3.5), _candidate(2, rating=3.0)]
+    selected = _select_candidates(UserPreferences(min_rating=4.5), candidates, 1)
+    assert _ids(selected) == ["1", "2"]
+
+
+def test_min_rating_filter():
+    candidates = [_candidate(1, rating=3.9), _candidate(2, rating=4.0), _candidate(3, rating=None)]
+    assert _ids(_select_candidates(UserPreferences(min_rating=4.0), candidates, 5)) == ["2"]
+
+
+def test_price_filter_ignores_case_and_whitespace():
+    candidates = [_candidate(1, price=" Medium "), _candidate(2, price="low"), _candidate(3, price=None)]
+    assert _ids(_select_candidates(UserPreferences(price_preference="MEDIUM "), candidates, 5)) == ["1"]
+
+
+def test_cuisine_filter_ranks_by_rating_plus_overlap():
+    candidates = [
+        _candidate(1, rating=4.5, cuisines=["Italian"]),
+        _candidate(2, rating=4.0, cuisines=["italian", "pizza"]),
+        _candidate(3, rating=4.9, cuisines=["indian"]),
+        _candidate(4, rating=4.9, cuisines=[]),
+    ]
+    prefs = UserPreferences(cuisine_preferences=["italian", " Pizza", ""])
+    assert _ids(_select_candidates(prefs, candidates, 5)) == ["2", "1"]
+
+
+def test_without_preferences_highest_rated_come_first():
+    candidates = [_candidate(1, rating=3.0), _candidate(2, rating=4.5), _candidate(3, rating=None)]
+    assert _ids(_select_candidates(UserPreferences(), candidates, 5)) == ["2", "1", "3"]
+
+
+@pytest.mark.parametrize("max_recommendations, limit", [(1, 10), (3, 10), (4, 12), (10, 30), (17, 50), (100, 50)])
+def test_limit_is_three_per_recommendation_between_10_and_50(max_recommendations, limit):
+    candidates = [_candidate(i, rating=i / 100) for i in range(80)]
+    selected = _select_candidates(UserPreferences(), candidates, max_recommendations)
+    assert _ids(selected) == [str(i) for i in range(79, 79 - limit, -1)]
+
+
+def test_falls_back_to_unfiltered_candidates_when_nothing_matches():
+    candidates = [_candidate(i, rating=3.0) for i in range(15)]
+    selected = _select_candidates(UserPreferences(min_rating=4.5, price_preference="premium"), candidates, 1)
+    # In input order, capped at the limit.
+    assert _ids(selected) == [str(i) for i in range(10)]
@@ -0,0 +1,121 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from phase3_llm.llm_client import GroqConfig, GroqLLMClient
+from phase3_llm.orchestrator import (
+    RestaurantCandidate,
+    UserPreferences,
+    _parse_llm_response,
+    _parse_partial_response,
+    stream_restaurant_recommendations,
+)
+
+from conftest import StubClient
+
+_RESPONSE = json.dumps(
+    {
+        "title": "Italian in Indiranagar",
+        "summary": 'A "summary" with quotes, a \\ backslash and café.',
+        "recommendations": [
+            {"restaurant_id": "123", "restaurant_name": "La Piazza", "match_score": 90, "reason": "Italian."}
+        ],
+    }
+)
+
+PREFS = UserPreferences(cuisine_preferences=["italian"])
+CANDIDATES = [RestaurantCandidate(id="123", name="La Piazza", rating=4.4, cuisines=["italian"])]
+
+
+def test_partial_response_waits_for_complete_summary():
+    summary_end = _RESPONSE.index('"recommendations"')
+    for cut in range(summary_end - 3):
+        assert _parse_partial_response(_RESPONSE[:cut]) is None, cut
+
+    partial = _parse_partial_response(_RESPONSE[:summary_end])
+    assert partial.title == "Italian in Indiranagar"
+    assert partial.summary == 'A "summary" with quotes, a \\ backslash and café.'
+    assert partial.recommendations == []
+
+
+def test_partial_response_defaults_missing_title():
+    partial = _parse_partial_response('{"summary": "S", "recommendations": [')
+    assert (partial.title, partial.summary) == ("Restaurant Recommendations", "S")
+
+
+def test_partial_response_searches_from_summary_pos():
+    text = '{"title": "T", "summary": "S"'
+    assert _parse_partial_response(text, text.index('"summary"')).summary == "S"
+    assert _parse_partial_response(text, len(text)) is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, len(_RESPONSE)])
+def test_stream_yields_partial_then_full_result(chunk_size):
+    client = StubClient(_RESPONSE, chunk_size=chunk_size)
+    results = list(stream_restaurant_recommendations(PREFS, CANDIDATES, client=client))
+
+    expected = _parse_llm_response(_RESPONSE)
+    partial, full = results
+    assert (partial.title, partial.summary) == (expected.title, expected.summary)
+    assert partial.recommendations == []
+    assert full == expected
+
+
+def test_stream_partial_is_sent_before_recommendations_arrive():
+    client = StubClient(_RESPONSE, chunk_size=1)
+    stream = stream_restaurant_recommendations(PREFS, CANDIDATES, client=client)
+    next(stream)
+    assert client.sent <= _RESPONSE.index('"recommendations"')
+    stream.close()
+
+
+def test_stream_closes_upstream_when_consumer_stops_early():
+    client = StubClient(_RESPONSE, chunk_size=1)
+    stream = stream_restaurant_recommendations(PREFS, CANDIDATES, client=client)
+    next(stream)
+    assert not client.closed
+    stream.close()
+    assert client.closed
+
+
+def test_stream_result_is_cached():
+    client = StubClient(_RESPONSE, chunk_size=5)
+    list(stream_restaurant_recommendations(PREFS, CANDIDATES, client=client))
+    client.text = "not json"
+    assert list(stream_restaurant_recommendations(PREFS, CANDIDATES, client=client)) == [
+        _parse_llm_response(_RESPONSE)
+    ]
+
+
+class _FakeGroqStream:
+    def __init__(self, deltas):
+        self.chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=d))]) for d in deltas]
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+
+def test_groq_client_stream_closes_response_on_early_exit():
+    fake = _FakeGroqStream(["a", None, "b", "c"])
+    client = GroqLLMClient(GroqConfig(api_key="test", model="stub-model"))
+    client._client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **params: fake))
+    )
+
+    deltas = client.chat_completion_stream(messages=[])
+    assert next(deltas) == "a"
+    assert next(deltas) == "b"
+    deltas.close()
+    assert fake.closed
+
+    fake.closed = False
+    assert list(client.chat_completion_stream(messages=[])) == ["a", "b", "c"]
+    assert fake.closed
@@ -2,10 +2,16 @@
 Streamlit UI for AI Restaurant Recommendation Service.
 Uses the Phase 4 API when available; falls back to bundled CSV when API is unreachable (e.g. on Streamlit Cloud).
 """
-import csv
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import pandas as pd
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
 
 st.set_page_config(
     page_title="Restaurant Recommendations",
@@ -23,55 +29,199 @@ API_BASE = st.sidebar.text_input(
     "API base URL",
     value="http://localhost:8080",
     help="Phase 4 API must be running on this URL.",
+).rstrip("/")
+API_TIMEOUT = st.sidebar.number_input(
+    "API timeout (s)",
+    min_value=1,
+    max_value=60,
+    value=10,
+    help="How long to wait for recommendations before falling back to offline data.",
 )
+HEALTH_URL = f"{API_BASE}/health"
+PLACES_URL = f"{API_BASE}/places"
+CUISINES_URL = f"{API_BASE}/cuisines"
+RECOMMENDATIONS_URL = f"{API_BASE}/recommendations"
+
+
+@st.cache_resource
+def get_http():
+    """
+    One keep-alive requests.Session per process for the health check and the
+    /places, /cuisines and /recommendations calls. cache_resource keeps it
+    (and its pooled connections) across reruns and user sessions; a plain
+    module-level Session would be rebuilt on every rerun.
+    """
+    s = requests.Session()
+    s.headers["User-Agent"] = "streamlit-ui"
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
 
+@st.cache_resource
+def get_pool():
+    """Process-wide worker pool for independent API calls, sized to match get_http()'s connection pool."""
+    return ThreadPoolExecutor(max_workers=4)
 
+
+# Any whitespace run collapses to one space, not just a doubled space.
+_WS = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
 def _norm(s):
-    return (s or "").strip().lower().replace("  ", " ")
+    # Cached: cities, localities and cuisines repeat heavily across rows.
+    return _WS.sub(" ", (s or "").strip()).lower()
 
 
-def load_places_cuisines_from_csv():
-    """Load places and cuisines from fixture CSV when API is unavailable. Returns (places, cuisines)."""
+def _fixture_mtime():
+    """Modification time of the fixture CSV (None if missing); used as a cache key."""
+    try:
+        return os.path.getmtime(FIXTURE_CSV)
+    except OSError:
+        return None
+
+
+_CSV_COLUMNS = ("id", "name", "std_city", "std_locality", "std_rating", "std_price_bucket", "std_cuisines")
+
+
+def _parse_rating(raw):
+    try:
+        return float(raw or 0)
+    except ValueError:
+        return None
+
+
+def _norm_col(col):
+    """Vectorized _norm over a string column."""
+    return col.str.strip().str.replace(_WS.pattern, " ", regex=True).str.lower()
+
+
+# cache_resource rather than cache_data: cache_data would unpickle a fresh
+# copy of the frame and index on every hit, costing more than the filtering.
+# The result is shared across sessions, so callers must treat it as
+# read-only; filtering builds new frames, and output lists are copied.
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_df(path: str, mtime: float):
+    """
+    Load the CSV once per (path, mtime) into column-oriented form: normalized
+    filter columns plus ready-to-emit output columns, so a request neither
+    re-normalizes rows nor converts fields for anything but the final top-N.
+    Unused CSV columns are dropped to keep the cached frame small.
+
+    Returns (df, cuisine_index), where cuisine_index maps each normalized
+    cuisine to the sorted row positions that serve it.
+    """
+    raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+    for name in _CSV_COLUMNS:
+        if name not in raw.columns:
+            raw[name] = ""
+    ratings = [_parse_rating(x) for x in raw["std_rating"]]
+    # Split std_cuisines once: the display list feeds the output and its
+    # normalized forms feed the index, so matches are never re-split.
+    cuisine_lists = []
+    cuisine_index = {}
+    for i, cuis in enumerate(raw["std_cuisines"]):
+        parts = [x.strip() for x in cuis.split("|") if x.strip()]
+        cuisine_lists.append(parts)
+        for c in {_norm(x) for x in parts}:
+            cuisine_index.setdefault(c, []).append(i)
+    df = pd.DataFrame(
+        {
+            # Output columns, shaped like the Phase 4 API's restaurant objects.
+            "id": raw["id"],
+            "name": raw["name"],
+            "city": raw["std_city"],
+            "locality": raw["std_locality"],
+            "rating": pd.Series(ratings, index=raw.index, dtype=object),
+            "price_bucket": raw["std_price_bucket"],
+            "cuisines": pd.Series(cuisine_lists, index=raw.index, dtype=object),
+            # Filter columns.
+            # "city|locality", so each location part needs one substring scan.
+            "_place_blob": _norm_col(raw["std_city"]) + "|" + _norm_col(raw["std_locality"]),
+            "_price_n": _norm_col(raw["std_price_bucket"]),
+            "_rating_f": [r or 0.0 for r in ratings],
+        }
+    )
+    return df, cuisine_index
+
+
+@st.cache_data(show_spinner=False)
+def load_places_cuisines_from_csv(mtime):
+    """Load places and cuisines from fixture CSV when API is unavailable. Pass _fixture_mtime(). Returns (places, cuisines)."""
     places = []
-    cuisines_set = set()
-    if not os.path.isfile(FIXTURE_CSV):
+    if mtime is None:
         return places, []
     try:
-        with open(FIXTURE_CSV, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            seen_places = set()
-            for row in reader:
-                city = (row.get("std_city") or "").strip()
-                locality = (row.get("std_locality") or "").strip()
-                if city or locality:
-                    label = f"{city}, {locality}".strip(", ")
-                    key = (city, locality)
-                    if key not in seen_places:
-                        seen_places.add(key)
-                        places.append({"label": label, "city": city, "locality": locality})
-                raw = row.get("std_cuisines") or ""
-                for part in raw.split("|"):
-                    c = _norm(part)
-                    if c:
-                        cuisines_set.add(c)
+        # Same cached parse as recommendations_from_csv, so the fallback path
+        # reads and parses the file once.
+        df, cuisine_index = _load_df(FIXTURE_CSV, mtime)
+        seen_places = set()
+        for city, locality in zip(df["city"].str.strip(), df["locality"].str.strip()):
+            if city or locality:
+                key = (city, locality)
+                if key not in seen_places:
+                    seen_places.add(key)
+                    places.append({"label": f"{city}, {locality}".strip(", "), "city": city, "locality": locality})
     except Exception:
         return [], []
     places.sort(key=lambda p: p["label"])
-    return places, sorted(cuisines_set)
+    return places, sorted(cuisine_index)
+
+
+def _place_options(places):
+    """Options for the Place selectbox: "" (all places) followed by one label per place."""
+    options = [""]
+    options.extend(
+        p.get("label") or f"{p.get('city', '')}, {p.get('locality', '')}".strip(", ") or "Unknown" for p in places
+    )
+    return options
+
+
+def _offline_options_stale(mtime):
+    """True if session_state has no offline options for this CSV mtime yet."""
+    opts = st.session_state.get("offline_options")
+    return opts is None or opts["mtime"] != mtime
+
+
+def _offline_options(pending=None):
+    """
+    Places, cuisines and place options from the fixture CSV. Kept in
+    st.session_state, keyed by the file's mtime, so reruns reuse them directly
+    instead of copying them out of st.cache_data and re-deriving the labels.
+    pending is an optional future for load_places_cuisines_from_csv already
+    started in the background; its result is used instead of loading here.
+    """
+    mtime = _fixture_mtime()
+    opts = st.session_state.get("offline_options")
+    if _offline_options_stale(mtime):
+        if pending is not None:
+            csv_places, csv_cuisines = pending.result()
+        else:
+            csv_places, csv_cuisines = load_places_cuisines_from_csv(mtime)
+        opts = {
+            "mtime": mtime,
+            "places": csv_places,
+            "cuisines": csv_cuisines,
+            "place_options": _place_options(csv_places),
+        }
+        st.session_state["offline_options"] = opts
+    return opts
 
 
 def recommendations_from_csv(payload: dict):
     """Recommendations by filtering the fixture CSV (same logic as Phase 4 API). Returns {restaurants, explanation, explanation_error}."""
-    if not os.path.isfile(FIXTURE_CSV):
+    mtime = _fixture_mtime()
+    if mtime is None:
         return {"restaurants": [], "explanation": None, "explanation_error": "CSV not found."}
     try:
-        with open(FIXTURE_CSV, newline="", encoding="utf-8") as f:
-            rows = list(csv.DictReader(f))
+        df, cuisine_index = _load_df(FIXTURE_CSV, mtime)
     except Exception as e:
         return {"restaurants": [], "explanation": None, "explanation_error": str(e)}
 
     location_raw = _norm(payload.get("location") or "")
-    location_parts = [p for p in location_raw.split(",") if p.strip()] if location_raw else []
+    location_parts = [p.strip() for p in location_raw.split(",") if p.strip()] if location_raw else []
     price_pref = _norm(payload.get("price_preference") or "")
     min_rating = payload.get("min_rating")
     if min_rating is not None:
@@ -85,50 +235,46 @@ def recommendations_from_csv(payload: dict):
     cuisine_prefs = [_norm(c) for c in cuisine_prefs if c]
     num_results = max(1, min(10, int(payload.get("num_results") or 5)))
 
-    filtered = []
-    for r in rows:
-        city = _norm(r.get("std_city") or "")
-        loc = _norm(r.get("std_locality") or "")
-        if location_parts:
-            if not all(
-                (city and p in city) or (loc and p in loc) for p in location_parts
-            ):
-                continue
-        if price_pref and _norm(r.get("std_price_bucket") or "") != price_pref:
-            continue
-        try:
-            rat = float(r.get("std_rating") or 0)
-        except (TypeError, ValueError):
-            rat = 0
-        if min_rating is not None and rat < min_rating:
-            continue
-        if cuisine_prefs:
-            raw_c = (r.get("std_cuisines") or "").split("|")
-            row_cuisines = {_norm(x) for x in raw_c if x}
-            if not any(c in row_cuisines for c in cuisine_prefs):
-                continue
-        filtered.append(r)
-
-    filtered.sort(key=lambda x: (-float(x.get("std_rating") or 0), x.get("name") or ""))
-    top = filtered[:num_results]
-
-    restaurants = []
-    for r in top:
-        cuisines_str = r.get("std_cuisines") or ""
-        cuisines_list = [c.strip() for c in cuisines_str.split("|") if c.strip()]
-        try:
-            rating = float(r.get("std_rating") or 0)
-        except (TypeError, ValueError):
-            rating = None
-        restaurants.append({
-            "id": r.get("id"),
-            "name": r.get("name") or "Unknown",
-            "city": r.get("std_city") or "",
-            "locality": r.get("std_locality") or "",
+    if cuisine_prefs:
+        # Only rows in the preferred cuisines' posting lists can match, so
+        # the remaining filters run on those rows instead of the whole file.
+        rows = set().union(*(cuisine_index.get(c, ()) for c in cuisine_prefs))
+        df = df.iloc[sorted(rows)]
+
+    # Cheapest predicates first, each applied to the previous survivors, so
+    # the substring scans for location only see rows that already pass the
+    # float compare and the price equality.
+    if min_rating is not None:
+        df = df[df["_rating_f"] >= min_rating]
+    if price_pref:
+        df = df[df["_price_n"] == price_pref]
+    for p in location_parts:
+        df = df[df["_place_blob"].str.contains(p, regex=False)]
+
+    filtered = df
+    # Heap-select the top ratings (O(N log k), k <= 10) rather than sorting
+    # every match; keep="all" retains ties at the cut so the name tie-break
+    # still sees them, and only that short list gets fully sorted.
+    top = (
+        filtered.nlargest(num_results, "_rating_f", keep="all")
+        .sort_values(["_rating_f", "name"], ascending=[False, True])
+        .head(num_results)
+    )
+
+    restaurants = [
+        {
+            "id": id_,
+            "name": name or "Unknown",
+            "city": city,
+            "locality": locality,
             "rating": rating,
-            "price_bucket": r.get("std_price_bucket") or "",
-            "cuisines": cuisines_list,
-        })
+            "price_bucket": price_bucket,
+            "cuisines": list(cuisines),
+        }
+        for id_, name, city, locality, rating, price_bucket, cuisines in zip(
+            top["id"], top["name"], top["city"], top["locality"], top["rating"], top["price_bucket"], top["cuisines"]
+        )
+    ]
 
     return {
         "restaurants": restaurants,
@@ -137,33 +283,53 @@ def recommendations_from_csv(payload: dict):
     }
 
 
-def fetch_json(path: str, show_error: bool = True):
-    try:
-        r = requests.get(f"{API_BASE.rstrip('/')}{path}", timeout=10)
-        r.raise_for_status()
-        return r.json()
-    except Exception as e:
-        if show_error:
-            st.sidebar.error(f"Cannot reach API: {e}")
-        return None
+def _get_json(url: str):
+    r = get_http().get(url, timeout=(2, 10))
+    r.raise_for_status()
+    return r.json()
+
+
+# API lookups are cached per URL so reruns don't repeat the HTTP calls.
+# They raise on failure instead of returning a fallback, because
+# st.cache_data does not cache exceptions; call them through _cached_or().
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_places(url: str):
+    return _get_json(url)["places"]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_cuisines(url: str):
+    return _get_json(url)["cuisines"]
+
 
+# Short TTL: re-probe at most every 10 s, so an API that goes down is noticed
+# quickly without probing on every rerun. The timeout stays under that cadence.
+@st.cache_data(ttl=10, show_spinner=False)
+def check_api_health(url: str):
+    """Return True if API is reachable; raises otherwise."""
+    r = get_http().get(url, timeout=(1, 2))
+    if r.status_code != 200:
+        raise requests.exceptions.HTTPError(f"Health check returned {r.status_code}", response=r)
+    return True
 
-def check_api_health():
-    """Return True if API is reachable."""
+
+def _cached_or(fetch, url: str, default):
+    """Call one of the cached API lookups, returning default if it fails."""
     try:
-        r = requests.get(f"{API_BASE.rstrip('/')}/health", timeout=5)
-        return r.status_code == 200
+        return fetch(url)
     except Exception:
-        return False
+        return default
 
 
-def get_recommendations(payload: dict):
+def get_recommendations(payload: dict, timeout: float = 10):
     """Call Phase 4 API for recommendations. Returns None if API unreachable (caller can use CSV fallback)."""
     try:
-        r = requests.post(
-            f"{API_BASE.rstrip('/')}/recommendations",
+        # (connect, read): a down API fails within 2 s; a slow LLM response
+        # gets `timeout` seconds before the CSV fallback takes over.
+        r = get_http().post(
+            RECOMMENDATIONS_URL,
             json=payload,
-            timeout=30,
+            timeout=(2, timeout),
         )
         r.raise_for_status()
         return r.json()
@@ -172,6 +338,55 @@ def get_recommendations(payload: dict):
         return None
 
 
+def _escape_directive(text: str) -> str:
+    """Escape text for a Markdown directive like :gray[...], where a bare ] or \\ would end or break it."""
+    return text.replace("\\", "\\\\").replace("]", "\\]")
+
+
+def render_results(result: dict):
+    """Render a recommendations result (the last one is kept in st.session_state["last_result"])."""
+    restaurants = result.get("restaurants") or []
+    explanation = result.get("explanation") or ""
+    explanation_error = result.get("explanation_error") or ""
+
+    st.success(f"Found **{len(restaurants)}** restaurant(s).")
+
+    if explanation_error:
+        st.warning(f"AI explanation: {explanation_error}")
+    elif explanation:
+        with st.expander("AI explanation", expanded=True):
+            st.write(explanation)
+
+    if not restaurants:
+        st.info("No restaurants matched your filters. Try relaxing price, place, or cuisine.")
+    else:
+        # One markdown block for all cards instead of four elements per card:
+        # far fewer delta messages to the frontend for the same layout.
+        cards = []
+        for r in restaurants:
+            name = r.get("name") or "Unknown"
+            locality = r.get("locality") or ""
+            city = r.get("city") or ""
+            rating = r.get("rating")
+            price_bucket = r.get("price_bucket") or ""
+            cuisines_str = ", ".join(r.get("cuisines") or [])
+
+            rating_str = f"⭐ {rating:.1f}" if isinstance(rating, (int, float)) else "–"
+            meta = f"{locality}{' • ' if locality and city else ''}{city}"
+            tags = (
+                f"{rating_str}"
+                f"{' ' + price_bucket if price_bucket else ''}"
+                f"{' ' + cuisines_str if cuisines_str else ''}"
+            )
+
+            cards.append(f"### {name}")
+            if meta:
+                cards.append(f":gray[{_escape_directive(meta)}]")
+            cards.append(tags)
+            cards.append("---")
+        st.markdown("\n\n".join(cards))
+
+
 st.sidebar.markdown("---")
 st.sidebar.markdown("**To fix \"Cannot reach API\"**")
 st.sidebar.markdown("Start the Phase 4 API in a **separate** PowerShell terminal:")
@@ -186,14 +401,49 @@ st.sidebar.code(
 st.sidebar.markdown("Then refresh this page or click **Get recommendations**.")
 st.sidebar.markdown("---")
 
+# The health probe and the /places and /cuisines GETs are independent, so
+# issue all three concurrently; the pool shares get_http()'s pooled sockets.
+# The probe is also rate-limited per session: at most once every
+# _HEALTH_CHECK_INTERVAL seconds (or when the URL changes), however fast
+# the user clicks around.
+_HEALTH_CHECK_INTERVAL = 5
+now = time.monotonic()
+probe_health = (
+    st.session_state.get("hc_url") != HEALTH_URL
+    or now - st.session_state.get("last_hc", 0) > _HEALTH_CHECK_INTERVAL
+)
+pool = get_pool()
+if probe_health:
+    health_future = pool.submit(_cached_or, check_api_health, HEALTH_URL, False)
+places_future = pool.submit(_cached_or, fetch_places, PLACES_URL, [])
+cuisines_future = pool.submit(_cached_or, fetch_cuisines, CUISINES_URL, [])
+if probe_health:
+    st.session_state.api_ok = health_future.result()
+    st.session_state.hc_url = HEALTH_URL
+    st.session_state.last_hc = now
+api_ok = st.session_state.api_ok
+places = places_future.result()
+cuisines = cuisines_future.result()
+
+# If the offline fallback will be needed and isn't in session_state yet,
+# start the CSV load now so it overlaps rendering the sidebar and header;
+# it is awaited just before the form.
+offline_future = None
+if not places or not cuisines:
+    mtime = _fixture_mtime()
+    if _offline_options_stale(mtime):
+        offline_future = pool.submit(load_places_cuisines_from_csv, mtime)
+
 # API status
-api_ok = check_api_health()
 if api_ok:
-    st.sidebar.success(f"API OK: {API_BASE.rstrip('/')}")
+    st.sidebar.success(f"API OK: {API_BASE}")
 else:
     st.sidebar.error(f"Cannot reach API at {API_BASE}")
     st.sidebar.markdown("Try **http://127.0.0.1:8080** if you use **localhost**.")
 if st.sidebar.button("Retry connection"):
+    # A manual retry bypasses both the cache and the rate limit.
+    check_api_health.clear()
+    st.session_state.last_hc = 0
     st.rerun()
 st.sidebar.markdown("---")
 
@@ -202,26 +452,15 @@ st.sidebar.markdown("---")
 st.title("🍽️ Restaurant Recommendations")
 st.caption("Set your preferences and get AI-powered restaurant suggestions (Groq).")
 
-# Load options from API, fallback to CSV when API unreachable
-places_resp = fetch_json("/places", show_error=False)
-if places_resp and "places" in places_resp:
-    places = places_resp["places"]
-else:
-    places = []
-
-cuisines_resp = fetch_json("/cuisines", show_error=False)
-if cuisines_resp and "cuisines" in cuisines_resp:
-    cuisines = cuisines_resp["cuisines"]
-else:
-    cuisines = []
-
 # Fallback: load from fixture CSV when API didn't return data (e.g. Streamlit Cloud)
+place_options = None
 if not places or not cuisines:
-    csv_places, csv_cuisines = load_places_cuisines_from_csv()
+    offline = _offline_options(offline_future)
     if not places:
-        places = csv_places
+        places = offline["places"]
+        place_options = offline["place_options"]
     if not cuisines:
-        cuisines = csv_cuisines
+        cuisines = offline["cuisines"]
     if places or cuisines:
         st.sidebar.info("Using offline data (API not connected).")
 
@@ -231,8 +470,8 @@ if not places and not cuisines:
         "`phase4_api/tests/fixtures/restaurants_processed.csv`, or start the Phase 4 API (see sidebar)."
     )
 
-place_labels = [p.get("label") or f"{p.get('city', '')}, {p.get('locality', '')}".strip(", ") or "Unknown" for p in places]
-place_options = [""] + place_labels
+if place_options is None:
+    place_options = _place_options(places)
 
 # Preferences form
 with st.form("preferences_form"):
@@ -282,45 +521,14 @@ if submitted:
         payload["cuisine_preferences"] = cuisine_selection
 
     with st.spinner("Fetching recommendations…"):
-        result = get_recommendations(payload)
+        result = get_recommendations(payload, timeout=API_TIMEOUT)
     if result is None:
         # API unreachable: use CSV fallback so app works on Streamlit Cloud / without API
         result = recommendations_from_csv(payload)
 
-    if result:
-        restaurants = result.get("restaurants") or []
-        explanation = result.get("explanation") or ""
-        explanation_error = result.get("explanation_error") or ""
+    # Keep the result in session_state so it survives later reruns (sidebar
+    # tweaks, form edits) without another API call.
+    st.session_state["last_result"] = result
 
-        st.success(f"Found **{len(restaurants)}** restaurant(s).")
-
-        if explanation_error:
-            st.warning(f"AI explanation: {explanation_error}")
-        elif explanation:
-            with st.expander("AI explanation", expanded=True):
-                st.write(explanation)
-
-        if not restaurants:
-            st.info("No restaurants matched your filters. Try relaxing price, place, or cuisine.")
-        else:
-            for r in restaurants:
-                name = r.get("name") or "Unknown"
-                locality = r.get("locality") or ""
-                city = r.get("city") or ""
-                rating = r.get("rating")
-                price_bucket = r.get("price_bucket") or ""
-                cuisines_str = ", ".join(r.get("cuisines") or [])
-
-                rating_str = f"⭐ {rating:.1f}" if isinstance(rating, (int, float)) else "–"
-                meta = " • ".join(filter(None, [locality, city]))
-                tags = [rating_str]
-                if price_bucket:
-                    tags.append(price_bucket)
-                if cuisines_str:
-                    tags.append(cuisines_str)
-
-                st.markdown(f"### {name}")
-                if meta:
-                    st.caption(meta)
-                st.write(" ".join(tags))
-                st.divider()
+if st.session_state.get("last_result"):
+    render_results(st.session_state["last_result"])